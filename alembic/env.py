@@ -3,16 +3,34 @@ import sys
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config
 
 # Make sure the project root is on sys.path so we can import app.*
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-# Import all models so Alembic can see them for autogenerate
-from app.models import Base  # noqa: E402
-
 config = context.config
 
+# Commands that only replay revision scripts never read target_metadata
+_SCRIPT_ONLY_COMMANDS = {"upgrade", "downgrade", "stamp", "current"}
+
+
+def _load_target_metadata():
+    """Import the ORM models only when a command compares against them (e.g. autogenerate).
+
+    Importing app.models pulls in pgvector and every model module; plain
+    upgrade/downgrade runs don't need any of it. Programmatic callers without
+    cmd_opts always get the metadata.
+    """
+    cmd_opts = config.cmd_opts
+    if cmd_opts is not None and cmd_opts.cmd[0].__name__ in _SCRIPT_ONLY_COMMANDS:
+        return None
+
+    # Import all models so Alembic can see them for autogenerate
+    from app.models import Base
+
+    return Base.metadata
+
+
 # Load database URL from environment (DATABASE_URL_SYNC uses the sync psycopg2 driver,
 # not asyncpg, because Alembic's CLI is synchronous)
 database_url = os.getenv(
@@ -21,11 +39,13 @@ database_url = os.getenv(
 )
 config.set_main_option("sqlalchemy.url", database_url)
 
-if config.config_file_name is not None:
+# Programmatic callers that already configured logging can set configure_logger=False
+# to skip re-parsing the ini file's logging sections
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # This is what tells Alembic which tables to create/track
-target_metadata = Base.metadata
+target_metadata = _load_target_metadata()
 
 
 def run_migrations_offline() -> None:
@@ -41,17 +61,32 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _run_migrations(connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
 def run_migrations_online() -> None:
-    """Apply migrations directly to the running database."""
+    """Apply migrations directly to the running database.
+
+    The whole revision chain runs on a single connection. Callers that already
+    hold one can pass it via config.attributes["connection"] to skip the connect.
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_migrations(connection)
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
     )
-    with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
-        with context.begin_transaction():
-            context.run_migrations()
+    try:
+        with connectable.connect() as connection:
+            _run_migrations(connection)
+    finally:
+        connectable.dispose()
 
 
 if context.is_offline_mode():
@@ -0,0 +1,55 @@
+"""jsonb_server_defaults
+
+Revision ID: b8e41d0c6a27
+Revises: 78791b1574ca
+Create Date: 2026-10-15 10:04:52.118930
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e41d0c6a27'
+down_revision: str | Sequence[str] | None = '78791b1574ca'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'contract_chunks', 'metadata',
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        server_default=sa.text("'{}'::jsonb"),
+    )
+    op.alter_column(
+        'clauses', 'metadata',
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        server_default=sa.text("'{}'::jsonb"),
+    )
+    op.alter_column(
+        'risk_assessments', 'flags',
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        server_default=sa.text("'[]'::jsonb"),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'risk_assessments', 'flags',
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        server_default=None,
+    )
+    op.alter_column(
+        'clauses', 'metadata',
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        server_default=None,
+    )
+    op.alter_column(
+        'contract_chunks', 'metadata',
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        server_default=None,
+    )
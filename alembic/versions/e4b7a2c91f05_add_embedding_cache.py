@@ -0,0 +1,34 @@
+"""add_embedding_cache
+
+Revision ID: e4b7a2c91f05
+Revises: b8e41d0c6a27
+Create Date: 2026-10-15 14:21:47.118302
+
+"""
+from collections.abc import Sequence
+
+import pgvector.sqlalchemy
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b7a2c91f05'
+down_revision: str | Sequence[str] | None = 'b8e41d0c6a27'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'embedding_cache',
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('content_sha256', sa.LargeBinary(length=32), nullable=False),
+        sa.Column('embedding', pgvector.sqlalchemy.vector.VECTOR(dim=1536), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('model', 'content_sha256'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('embedding_cache')
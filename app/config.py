@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Literal
 
 from pydantic_settings import BaseSettings
@@ -17,10 +18,15 @@ class Settings(BaseSettings):
     LLM_MODEL: str = "gpt-4o-mini"
     EMBEDDING_MODEL: str = "text-embedding-3-small"
     EMBEDDING_DIMENSION: int = 1536
+    EMBEDDING_MAX_CONCURRENCY: int = 8  # parallel embedding API requests per embed() call
 
     # Database
     DATABASE_URL: str  # async driver (asyncpg)
     DATABASE_URL_SYNC: str  # sync driver (for Alembic CLI)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30  # keep bounded — unlimited overflow lets asyncpg connections pile up
+    DB_POOL_TIMEOUT: int = 10  # seconds to wait for a free connection before erroring
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced
 
     # Redis
     REDIS_URL: str = "redis://redis:6379/0"
@@ -31,9 +37,16 @@ class Settings(BaseSettings):
     MAX_UPLOAD_SIZE_MB: int = 20
     LLM_MAX_CHARS: int = 400_000  # reduce for providers with small context/rate limits
     LLM_MAX_OUTPUT_TOKENS: int = 4000  # reduce for providers with low TPM limits
+    LLM_CACHE_TTL_SECONDS: int = 30 * 24 * 3600  # clause extraction response cache in Redis; 0 disables
 
     # App
     LOG_LEVEL: str = "INFO"
     DEBUG: bool = False
 
-    model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
+    model_config = {"env_file": ".env", "env_file_encoding": "utf-8", "defer_build": True}
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, parsing env/.env only once."""
+    return Settings()
@@ -8,8 +8,11 @@ def create_engine(settings: Settings):
     return create_async_engine(
         settings.DATABASE_URL,
         echo=settings.DEBUG,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,  # drop stale connections (e.g. after a Postgres restart) before use
     )
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any, Callable
 
@@ -7,17 +8,43 @@ logger = logging.getLogger(__name__)
 class EventBus:
     def __init__(self) -> None:
         self._handlers: dict[type, list[Callable]] = {}
+        # Immutable snapshot of _handlers read on publish — rebuilt on every register
+        self._dispatch: dict[type, tuple[Callable, ...]] = {}
+        self.frozen = False
 
     def register(self, event_type: type, handler: Callable) -> None:
+        if self.frozen:
+            raise RuntimeError("EventBus is frozen — register handlers before freeze()")
         self._handlers.setdefault(event_type, []).append(handler)
+        self._compile()
 
-    def publish(self, event: Any) -> None:
-        handlers = self._handlers.get(type(event), [])
-        if not handlers:
-            logger.warning(f"No handlers registered for {type(event).__name__}")
+    def freeze(self) -> None:
+        """Lock the handler topology once app setup is done. Further register() calls raise."""
+        self._compile()
+        self.frozen = True
+
+    def _compile(self) -> None:
+        self._dispatch = {k: tuple(v) for k, v in self._handlers.items()}
+
+    async def publish_async(self, event: Any) -> None:
+        """Publish from async code without blocking the event loop.
+
+        Coroutine handlers are awaited; sync handlers (e.g. ones doing a blocking
+        Redis round-trip via Celery) run in the default thread pool executor.
+        """
+        try:
+            handlers = self._dispatch[type(event)]
+        except KeyError:
+            # %-style args are only formatted if the record is emitted; the guard also skips the __name__ lookup
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("No handlers registered for %s", type(event).__name__)
             return
+        loop = asyncio.get_running_loop()
         for handler in handlers:
-            handler(event)
+            if asyncio.iscoroutinefunction(handler):
+                await handler(event)
+            else:
+                await loop.run_in_executor(None, handler, event)
 
 
 event_bus = EventBus()
@@ -6,8 +6,11 @@ logger = logging.getLogger(__name__)
 
 
 def on_contract_uploaded(event: ContractUploaded) -> None:
+    # Sync on purpose: .delay() is a blocking Redis round-trip, so EventBus.publish_async
+    # runs this handler in a worker thread instead of on the event loop.
     # Lazy import avoids loading Celery worker code into the FastAPI process at module level
     from app.workers.contract_tasks import build_processing_chain
 
-    logger.info(f"ContractUploaded event received for {event.contract_id}, dispatching chain")
-    build_processing_chain(str(event.contract_id)).delay()
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("ContractUploaded event received for %s, dispatching chain", event.contract_id)
+    build_processing_chain(event.contract_id).delay()
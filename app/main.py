@@ -5,9 +5,10 @@ from typing import AsyncGenerator
 from fastapi import FastAPI
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import Settings
+from app.config import get_settings
 from app.database import create_engine, create_session_factory
 from app.middleware import RequestIDLogFilter, RequestIDMiddleware
+from app.repositories.llm_usage_log_repo import LLMUsageLogBuffer
 
 
 def configure_logging(log_level: str) -> None:
@@ -31,26 +32,34 @@ def configure_logging(log_level: str) -> None:
 
 @asynccontextmanager
 async def lifespan(application: FastAPI) -> AsyncGenerator:
-    """Manage application lifecycle: set up DB engine on startup, dispose on shutdown."""
-    settings: Settings = application.state.settings
-    engine = create_engine(settings)
-    session_factory = create_session_factory(engine)
-    application.state.engine = engine
-    application.state.session_factory = session_factory
+    """Manage application lifecycle: start background writers and clients on startup; close them on exit."""
+    from app.services.llm.factory import create_openai_client
+    # Built here, not in create_app, so its connection pool binds to the serving loop
+    application.state.openai_client = create_openai_client(application.state.settings.OPENAI_API_KEY)
+    application.state.usage_log_buffer.start()
+
+    from app.services.contract_service import UPLOAD_DIR
+    # Once per process, not once per upload
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
     from app.events.bus import event_bus
     from app.events.contract_events import ContractUploaded
     from app.events.handlers.contract_handlers import on_contract_uploaded
-    event_bus.register(ContractUploaded, on_contract_uploaded)
+    # The bus is process-global; a second lifespan (e.g. in tests) must not re-register
+    if not event_bus.frozen:
+        event_bus.register(ContractUploaded, on_contract_uploaded)
+        event_bus.freeze()
 
     yield
 
+    await application.state.usage_log_buffer.close()
+    await application.state.openai_client.close()
     await application.state.engine.dispose()
 
 
 def create_app() -> FastAPI:
     """Application factory."""
-    settings = Settings()
+    settings = get_settings()
 
     application = FastAPI(
         title="Pactly",
@@ -60,14 +69,22 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Engine and session factory are built once per app, not per lifespan or request.
+    # create_async_engine does not connect until first use, so this is safe at import time.
+    engine = create_engine(settings)
+    session_factory = create_session_factory(engine)
     application.state.settings = settings
+    application.state.engine = engine
+    application.state.session_factory = session_factory
+    usage_log_buffer = LLMUsageLogBuffer(session_factory)
+    application.state.usage_log_buffer = usage_log_buffer
 
     configure_logging(settings.LOG_LEVEL)
     application.add_middleware(RequestIDMiddleware)
 
     # Database session dependency — injected into every route that needs DB access
     async def get_session() -> AsyncGenerator[AsyncSession, None]:
-        async with application.state.session_factory() as session:
+        async with session_factory() as session:
             try:
                 yield session
                 await session.commit()
@@ -92,7 +109,10 @@ def create_app() -> FastAPI:
     async def get_clause_service_with_session(
         session: AsyncSession = Depends(get_session),
     ) -> ClauseService:
-        return ClauseService(llm=create_llm_provider(settings), repo=ClauseRepository(session))
+        return ClauseService(
+            llm=create_llm_provider(settings, application.state.openai_client),
+            repo=ClauseRepository(session),
+        )
 
     from app.repositories.embedding_repo import EmbeddingRepository
     from app.routers.query import router as query_router, get_query_service
@@ -104,13 +124,16 @@ def create_app() -> FastAPI:
     ) -> QueryService:
         return QueryService(
             session=session,
-            llm=create_llm_provider(settings),
+            llm=create_llm_provider(settings, application.state.openai_client),
             embedding_service=EmbeddingService(
                 api_key=settings.OPENAI_API_KEY,
                 model=settings.EMBEDDING_MODEL,
                 dimensions=settings.EMBEDDING_DIMENSION,
+                max_concurrency=settings.EMBEDDING_MAX_CONCURRENCY,
+                client=application.state.openai_client,
             ),
             llm_provider_name=settings.LLM_PROVIDER,
+            usage_log_buffer=usage_log_buffer,
         )
 
     from app.routers.analysis import router as analysis_router, get_risk_service
@@ -121,7 +144,7 @@ def create_app() -> FastAPI:
     ) -> RiskService:
         return RiskService(
             session=session,
-            llm=create_llm_provider(settings),
+            llm=create_llm_provider(settings, application.state.openai_client),
             llm_provider_name=settings.LLM_PROVIDER,
         )
 
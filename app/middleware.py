@@ -2,29 +2,50 @@ import logging
 import uuid
 from contextvars import ContextVar
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Context variable — stores the request ID for the current async task.
 # Each request gets its own isolated value, even under concurrent load.
 request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
 
+_REQUEST_ID_HEADER = b"x-request-id"
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+
+class RequestIDMiddleware:
     """Attach a unique request ID to every incoming request.
 
     Reads X-Request-ID from the request header if provided by the caller,
     otherwise generates a new UUID. Injects it into the response headers too
     so the caller can correlate their logs with ours.
+
+    Written as plain ASGI rather than BaseHTTPMiddleware to avoid the extra
+    task group and response streaming wrapper it adds to every request.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # ASGI header names are already lower-cased bytes
+        request_id = ""
+        for name, value in scope["headers"]:
+            if name == _REQUEST_ID_HEADER:
+                request_id = value.decode("latin-1")
+                break
+        request_id = request_id or str(uuid.uuid4())
         request_id_var.set(request_id)
 
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
 
 
 class RequestIDLogFilter(logging.Filter):
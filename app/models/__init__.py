@@ -2,7 +2,8 @@ from app.models.base import Base
 from app.models.clause import Clause
 from app.models.chunk import ContractChunk
 from app.models.contract import Contract
+from app.models.embedding_cache import EmbeddingCache
 from app.models.llm_usage_log import LLMUsageLog
 from app.models.risk_assessment import RiskAssessment
 
-__all__ = ["Base", "Contract", "ContractChunk", "Clause", "RiskAssessment", "LLMUsageLog"]
+__all__ = ["Base", "Contract", "ContractChunk", "Clause", "RiskAssessment", "LLMUsageLog", "EmbeddingCache"]
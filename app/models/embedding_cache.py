@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import DateTime, LargeBinary, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class EmbeddingCache(Base):
+    """Content-addressed embeddings, shared across contracts.
+
+    Keyed on (model, SHA-256 of the chunk text), so boilerplate that repeats
+    between contracts is embedded once per model.
+    """
+
+    __tablename__ = "embedding_cache"
+
+    model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    content_sha256: Mapped[bytes] = mapped_column(LargeBinary(32), primary_key=True)
+    embedding: Mapped[list[float]] = mapped_column(Vector(1536), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
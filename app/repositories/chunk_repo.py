@@ -1,9 +1,13 @@
 import uuid
 
-from sqlalchemy import select
+import numpy as np
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Text, cast, delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.chunk import ContractChunk
+from app.repositories.copy import COPY_THRESHOLD, copy_rows
 
 
 class ChunkRepository:
@@ -18,18 +22,62 @@ class ChunkRepository:
         )
         return list(result.scalars().all())
 
+    async def delete_by_contract_id(self, contract_id: uuid.UUID) -> None:
+        """Delete all chunks of a contract in one statement."""
+        await self.session.execute(delete(ContractChunk).where(ContractChunk.contract_id == contract_id))
+
     async def bulk_update_embeddings(
-        self, chunks: list[ContractChunk], embeddings: list[list[float]]
+        self, chunks: list[ContractChunk], embeddings: np.ndarray
     ) -> None:
-        for chunk, embedding in zip(chunks, embeddings):
-            chunk.embedding = embedding
-        await self.session.flush()
+        """Write all embeddings in a single UPDATE ... FROM unnest(ids, vectors) statement.
+
+        One statement and one round trip however many chunks there are, rather than an
+        executemany of per-row UPDATEs. Vectors travel as a text[] of pgvector literals
+        and are cast server-side. Bypasses the unit of work, so the in-memory chunk
+        objects keep their old embedding value — reload them if you need the new vectors.
+        """
+        if not chunks:
+            return
+        data = select(
+            func.unnest(cast([chunk.id for chunk in chunks], ARRAY(UUID(as_uuid=True)))).label("id"),
+            func.unnest(cast([_vector_literal(e) for e in embeddings], ARRAY(Text))).label("embedding"),
+        ).subquery()
+        await self.session.execute(
+            update(ContractChunk)
+            .where(ContractChunk.id == data.c.id)
+            .values(embedding=cast(data.c.embedding, Vector(embeddings.shape[1])))
+            .execution_options(synchronize_session=False)
+        )
 
     async def bulk_create(
-        self, contract_id: uuid.UUID, chunks: list[dict]
-    ) -> list[ContractChunk]:
-        """Insert multiple chunks in one flush. Each dict must have: chunk_index, content, token_count."""
-        objects = [ContractChunk(contract_id=contract_id, **chunk) for chunk in chunks]
-        self.session.add_all(objects)
-        await self.session.flush()
-        return objects
+        self, contract_id: uuid.UUID, chunks: list[tuple[int, str, int]]
+    ) -> list[uuid.UUID]:
+        """Insert multiple chunks in one batched INSERT. Each row is (chunk_index, content, token_count).
+
+        Batches of COPY_THRESHOLD rows or more go through Postgres COPY instead.
+        Skips ORM instance construction entirely — returns only the new row IDs.
+        """
+        if not chunks:
+            return []
+        if len(chunks) >= COPY_THRESHOLD:
+            ids = [uuid.uuid4() for _ in chunks]
+            await copy_rows(
+                self.session,
+                ContractChunk.__table__,
+                ["id", "contract_id", "chunk_index", "content", "token_count"],
+                ((chunk_id, contract_id, *chunk) for chunk_id, chunk in zip(ids, chunks)),
+            )
+            return ids
+        result = await self.session.execute(
+            insert(ContractChunk).returning(ContractChunk.id),
+            [
+                {"contract_id": contract_id, "chunk_index": index, "content": content, "token_count": token_count}
+                for index, content, token_count in chunks
+            ],
+        )
+        return list(result.scalars().all())
+
+
+def _vector_literal(embedding: np.ndarray) -> str:
+    """Format one row as a pgvector text literal: [x1,x2,...]."""
+    return "[" + ",".join(map(str, embedding.tolist())) + "]"
@@ -1,9 +1,10 @@
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.clause import Clause
+from app.repositories.copy import COPY_THRESHOLD, copy_rows
 
 
 class ClauseRepository:
@@ -18,9 +19,32 @@ class ClauseRepository:
 
     async def bulk_create(
         self, contract_id: uuid.UUID, clauses: list[dict]
-    ) -> list[Clause]:
-        """Insert multiple clauses in one flush."""
-        objects = [Clause(contract_id=contract_id, **clause) for clause in clauses]
-        self.session.add_all(objects)
-        await self.session.flush()
-        return objects
+    ) -> list[uuid.UUID]:
+        """Insert multiple clauses in one batched INSERT (COPY for large batches). Returns the new row IDs."""
+        if not clauses:
+            return []
+        if len(clauses) >= COPY_THRESHOLD:
+            ids = [uuid.uuid4() for _ in clauses]
+            await copy_rows(
+                self.session,
+                Clause.__table__,
+                ["id", "contract_id", "clause_type", "title", "content", "summary", "section_reference"],
+                (
+                    (
+                        clause_id,
+                        contract_id,
+                        clause["clause_type"],
+                        clause["title"],
+                        clause["content"],
+                        clause["summary"],
+                        clause.get("section_reference"),
+                    )
+                    for clause_id, clause in zip(ids, clauses)
+                ),
+            )
+            return ids
+        result = await self.session.execute(
+            insert(Clause).returning(Clause.id),
+            [{"contract_id": contract_id, **clause} for clause in clauses],
+        )
+        return list(result.scalars().all())
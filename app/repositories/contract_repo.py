@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.contract import Contract
@@ -11,11 +11,11 @@ class ContractRepository:
         self.session = session
 
     async def create(self, **kwargs) -> Contract:
-        contract = Contract(**kwargs)
-        self.session.add(contract)
-        await self.session.flush()
-        await self.session.refresh(contract)
-        return contract
+        """Insert a contract and get the full row back (incl. server defaults) in one round-trip."""
+        result = await self.session.execute(
+            insert(Contract).values(**kwargs).returning(Contract)
+        )
+        return result.scalar_one()
 
     async def get_by_id(self, contract_id: uuid.UUID) -> Contract | None:
         result = await self.session.execute(
@@ -23,6 +23,19 @@ class ContractRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_raw_text(self, contract_id: uuid.UUID) -> str | None:
+        """Fetch only raw_text — no ORM hydration of the rest of the row."""
+        result = await self.session.execute(
+            select(Contract.raw_text).where(Contract.id == contract_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_file_path(self, contract_id: uuid.UUID) -> str | None:
+        result = await self.session.execute(
+            select(Contract.file_path).where(Contract.id == contract_id)
+        )
+        return result.scalar_one_or_none()
+
     async def get_by_file_hash(self, file_hash: str) -> Contract | None:
         result = await self.session.execute(
             select(Contract).where(Contract.file_hash == file_hash)
@@ -32,12 +45,20 @@ class ContractRepository:
     async def update_status(
         self, contract_id: uuid.UUID, status: str, error_message: str | None = None
     ) -> None:
-        contract = await self.get_by_id(contract_id)
-        if contract:
-            contract.status = status
-            if error_message:
-                contract.error_message = error_message
-            await self.session.flush()
+        """Set status (and optionally error_message) in one UPDATE. No-op if the contract doesn't exist."""
+        values: dict = {"status": status}
+        if error_message:
+            values["error_message"] = error_message
+        await self.session.execute(
+            update(Contract).where(Contract.id == contract_id).values(**values)
+        )
+
+    async def commit(self) -> None:
+        """Commit now instead of when the request's session dependency exits.
+
+        For writes that another process must see before this request finishes.
+        """
+        await self.session.commit()
 
     async def delete(self, contract_id: uuid.UUID) -> None:
         contract = await self.get_by_id(contract_id)
@@ -45,11 +66,8 @@ class ContractRepository:
             await self.session.delete(contract)
             await self.session.flush()
 
-    async def update(self, contract_id: uuid.UUID, **kwargs) -> Contract | None:
-        contract = await self.get_by_id(contract_id)
-        if not contract:
-            return None
-        for key, value in kwargs.items():
-            setattr(contract, key, value)
-        await self.session.flush()
-        return contract
+    async def update(self, contract_id: uuid.UUID, **kwargs) -> None:
+        """Set the given columns in one UPDATE — no SELECT first. No-op if the contract doesn't exist."""
+        await self.session.execute(
+            update(Contract).where(Contract.id == contract_id).values(**kwargs)
+        )
@@ -0,0 +1,20 @@
+from collections.abc import Iterable
+
+from sqlalchemy import Table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Below this many rows a multi-row INSERT is as fast as COPY and keeps the ORM path
+COPY_THRESHOLD = 100
+
+
+async def copy_rows(session: AsyncSession, table: Table, columns: list[str], records: Iterable[tuple]) -> None:
+    """Bulk-load records into table with Postgres COPY via the session's asyncpg connection.
+
+    Runs inside the session's current transaction. `columns` are column names (not
+    ORM attribute names) and each record is a tuple in that order; records may be a
+    generator, so no per-row dicts are needed. Omitted columns get their server
+    defaults; Python-side defaults are NOT applied.
+    """
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(table.name, columns=columns, records=records)
@@ -0,0 +1,41 @@
+from collections.abc import Sequence
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.embedding_cache import EmbeddingCache
+
+
+class EmbeddingCacheRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_many(self, model: str, hashes: list[bytes]) -> dict[bytes, np.ndarray]:
+        """Return cached embeddings for whichever of the content hashes are known, keyed by hash."""
+        if not hashes:
+            return {}
+        result = await self.session.execute(
+            select(EmbeddingCache.content_sha256, EmbeddingCache.embedding).where(
+                EmbeddingCache.model == model, EmbeddingCache.content_sha256.in_(set(hashes))
+            )
+        )
+        return {content_sha256: embedding for content_sha256, embedding in result.all()}
+
+    async def put_many(self, model: str, hashes: list[bytes], embeddings: Sequence[np.ndarray]) -> None:
+        """Store embeddings by content hash. Rows another worker already wrote are left alone.
+
+        Rows are inserted in hash order, so two transactions writing overlapping hashes take
+        their row locks in the same order and can only wait on each other, never deadlock.
+        Commit promptly — until then a concurrent insert of the same hash blocks.
+        """
+        if not hashes:
+            return
+        await self.session.execute(
+            insert(EmbeddingCache).on_conflict_do_nothing(index_elements=["model", "content_sha256"]),
+            [
+                {"model": model, "content_sha256": content_sha256, "embedding": embedding}
+                for content_sha256, embedding in sorted(zip(hashes, embeddings), key=lambda row: row[0])
+            ],
+        )
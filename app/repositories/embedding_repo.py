@@ -1,7 +1,9 @@
 import uuid
 
+import numpy as np
 from sqlalchemy import Float, cast, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.models.chunk import ContractChunk
 
@@ -13,7 +15,7 @@ class EmbeddingRepository:
     async def similarity_search(
         self,
         contract_id: uuid.UUID,
-        query_embedding: list[float],
+        query_embedding: np.ndarray,
         top_k: int = 5,
     ) -> list[tuple[ContractChunk, float]]:
         """Return the top_k chunks most similar to the query embedding.
@@ -21,16 +23,37 @@ class EmbeddingRepository:
         Uses pgvector's cosine distance operator (<=>) — lower distance means
         more similar. Cosine distance is converted to similarity (1 - distance)
         so callers get an intuitive score where 1.0 = identical, 0.0 = opposite.
+
+        Ranking is exact over this contract's chunks, found through the
+        uq_chunk_contract_index btree. Deliberately no ANN index: one would be global,
+        so an index scan would pick ~ef_search nearest chunks across all contracts and
+        only then filter by contract — often leaving fewer than top_k rows, or none —
+        and every embedding write would pay to maintain it. One contract's chunks are
+        few enough to score them all.
+
+        Runs in two passes: rank on (id, distance) only, then hydrate just the
+        winning rows. The ranking pass never ships chunk text or metadata.
         """
         distance_expr = cast(ContractChunk.embedding.op("<=>")(query_embedding), Float).label("distance")
+        ranked = (
+            await self.session.execute(
+                select(ContractChunk.id, distance_expr)
+                .where(ContractChunk.contract_id == contract_id)
+                .where(ContractChunk.embedding.is_not(None))
+                .order_by(distance_expr)
+                .limit(top_k)
+            )
+        ).all()
+        if not ranked:
+            return []
+
         result = await self.session.execute(
-            select(ContractChunk, distance_expr)
-            .where(ContractChunk.contract_id == contract_id)
-            .where(ContractChunk.embedding.is_not(None))
-            .order_by(distance_expr)
-            .limit(top_k)
+            select(ContractChunk)
+            .where(ContractChunk.id.in_([chunk_id for chunk_id, _ in ranked]))
+            .options(defer(ContractChunk.embedding))
         )
+        chunks_by_id = {chunk.id: chunk for chunk in result.scalars().all()}
         return [
-            (chunk, round(1.0 - float(distance), 4))
-            for chunk, distance in result.all()
+            (chunks_by_id[chunk_id], round(1.0 - float(distance), 4))
+            for chunk_id, distance in ranked
         ]
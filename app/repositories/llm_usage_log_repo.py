@@ -1,7 +1,15 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import logging
+import uuid
+
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models.llm_usage_log import LLMUsageLog
 
+logger = logging.getLogger(__name__)
+
 
 class LLMUsageLogRepository:
     def __init__(self, session: AsyncSession):
@@ -13,3 +21,95 @@ class LLMUsageLogRepository:
         self.session.add(log)
         await self.session.flush()
         return log
+
+    async def create_many(self, rows: list[dict]) -> list[uuid.UUID]:
+        """Log several LLM calls in one multi-row INSERT. Each dict has the same fields as create()."""
+        if not rows:
+            return []
+        result = await self.session.execute(insert(LLMUsageLog).returning(LLMUsageLog.id), rows)
+        return list(result.scalars().all())
+
+
+class LLMUsageLogBuffer:
+    """Queue LLM usage rows and insert them in batches from a background task.
+
+    Takes the usage-log INSERT off the request path: add() only enqueues, and
+    rows are written in one multi-row INSERT every batch_size rows or
+    flush_interval seconds, whichever comes first. Must be started inside a
+    running event loop and closed on shutdown so queued rows are not lost.
+
+    The queue holds at most max_queued rows. If the database is down long enough
+    to fill it, further rows are dropped (and counted in the log) rather than
+    growing memory without bound.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = 50,
+        flush_interval: float = 2.0,
+        max_queued: int = 10_000,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queued = max_queued
+        self.dropped = 0
+        self._queue: asyncio.Queue[dict | None] | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        # Queue is created here so it binds to the loop the app is actually served on
+        self._queue = asyncio.Queue(maxsize=self.max_queued)
+        self._task = asyncio.create_task(self._run())
+
+    def add(self, **kwargs) -> None:
+        """Enqueue one LLM call. Same fields as LLMUsageLogRepository.create."""
+        if self._queue is None:
+            raise RuntimeError("LLMUsageLogBuffer.start() must be called before add()")
+        try:
+            self._queue.put_nowait(kwargs)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning("LLM usage log queue full, %d rows dropped so far", self.dropped)
+
+    async def close(self) -> None:
+        """Flush everything queued so far and stop the background task."""
+        if self._task is None:
+            return
+        # Waits for room if the queue is full — the stop sentinel must not be dropped
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                return
+            rows = [first]
+            deadline = loop.time() + self.flush_interval
+            while len(rows) < self.batch_size:
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                rows.append(row)
+            await self._write(rows)
+
+    async def _write(self, rows: list[dict]) -> None:
+        try:
+            async with self.session_factory() as session:
+                await LLMUsageLogRepository(session).create_many(rows)
+                await session.commit()
+        except (SQLAlchemyError, OSError, TimeoutError):
+            # Usage logging must never take down the flusher — drop the batch and keep going.
+            # asyncpg connection failures arrive as raw OSError/TimeoutError, not SQLAlchemyError.
+            logger.exception("Failed to write %d LLM usage log rows", len(rows))
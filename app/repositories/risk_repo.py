@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -12,11 +12,18 @@ class RiskRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def bulk_create(self, assessments: list[dict]) -> list[RiskAssessment]:
-        objects = [RiskAssessment(**a) for a in assessments]
-        self.session.add_all(objects)
-        await self.session.flush()
-        return objects
+    async def bulk_create(self, assessments: list[dict]) -> list[uuid.UUID]:
+        """Insert all assessments in one batched INSERT. Returns the new row IDs.
+
+        Only the id is returned — server-generated created_at is not fetched back,
+        unlike add_all + flush which adds it to RETURNING for every row.
+        """
+        if not assessments:
+            return []
+        result = await self.session.execute(
+            insert(RiskAssessment).returning(RiskAssessment.id), assessments
+        )
+        return list(result.scalars().all())
 
     async def get_clauses_with_risk(self, contract_id: uuid.UUID) -> list[Clause]:
         """Fetch all clauses for a contract with risk assessments eagerly loaded.
@@ -26,12 +26,13 @@ async def get_analysis(
     service: RiskService = Depends(get_risk_service),
 ):
     """Get full contract analysis: all clauses with risk scores and overall contract risk."""
-    logger.info(f"Analysis request: contract_id={contract_id}")
+    logger.info("Analysis request: contract_id=%s", contract_id)
     try:
         result = await service.get_analysis(contract_id)
         logger.info(
-            f"Analysis response: contract_id={contract_id} "
-            f"overall={result.overall_risk_level} clauses={result.clause_count}"
+            "Analysis response: contract_id=%s "
+            "overall=%s clauses=%s",
+            contract_id, result.overall_risk_level, result.clause_count,
         )
         return result
     except ContractNotFoundError:
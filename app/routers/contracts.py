@@ -1,7 +1,7 @@
 import logging
 import uuid
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Header, HTTPException, UploadFile, status
 
 from app.exceptions import ContractNotFoundError, DuplicateContractError, UnsupportedFileTypeError
 from app.schemas.clause import ClauseResponse
@@ -25,20 +25,26 @@ def get_clause_service() -> ClauseService:
 
 @router.post("", response_model=ContractUploadResponse, status_code=status.HTTP_201_CREATED)
 async def upload_contract(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
+    x_content_sha256: str | None = Header(None, pattern=r"^[0-9a-fA-F]{64}$"),
     service: ContractService = Depends(get_contract_service),
 ):
-    """Upload a PDF or DOCX contract for analysis."""
-    logger.info(f"Upload request received: filename={file.filename!r} content_type={file.content_type!r}")
+    """Upload a PDF or DOCX contract for analysis.
+
+    Clients that already know the file's SHA-256 can send it as X-Content-SHA256 so
+    duplicates are rejected without the file being hashed or stored.
+    """
+    logger.info("Upload request received: filename=%r content_type=%r", file.filename, file.content_type)
     try:
-        result = await service.upload_contract(file)
-        logger.info(f"Upload accepted: contract_id={result.id} filename={result.filename!r} status={result.status}")
+        result = await service.upload_contract(file, background_tasks, x_content_sha256)
+        logger.info("Upload accepted: contract_id=%s filename=%r status=%s", result.id, result.filename, result.status)
         return result
     except UnsupportedFileTypeError as e:
-        logger.warning(f"Upload rejected — unsupported file type: {file.content_type!r}")
+        logger.warning("Upload rejected — unsupported file type: %r", file.content_type)
         raise HTTPException(status_code=422, detail=str(e))
     except DuplicateContractError:
-        logger.warning(f"Upload rejected — duplicate file: filename={file.filename!r}")
+        logger.warning("Upload rejected — duplicate file: filename=%r", file.filename)
         raise HTTPException(status_code=409, detail="This contract has already been uploaded.")
 
 
@@ -48,13 +54,13 @@ async def get_contract(
     service: ContractService = Depends(get_contract_service),
 ):
     """Get contract details and current processing status."""
-    logger.info(f"Get contract: contract_id={contract_id}")
+    logger.info("Get contract: contract_id=%s", contract_id)
     try:
         result = await service.get_contract(contract_id)
-        logger.info(f"Get contract response: contract_id={contract_id} status={result.status}")
+        logger.info("Get contract response: contract_id=%s status=%s", contract_id, result.status)
         return result
     except ContractNotFoundError:
-        logger.warning(f"Get contract — not found: contract_id={contract_id}")
+        logger.warning("Get contract — not found: contract_id=%s", contract_id)
         raise HTTPException(status_code=404, detail=f"Contract {contract_id} not found.")
 
 
@@ -64,9 +70,9 @@ async def get_clauses(
     service: ClauseService = Depends(get_clause_service),
 ):
     """Get all extracted clauses for a contract."""
-    logger.info(f"Get clauses: contract_id={contract_id}")
+    logger.info("Get clauses: contract_id=%s", contract_id)
     clauses = await service.get_clauses(contract_id)
-    logger.info(f"Get clauses response: contract_id={contract_id} count={len(clauses)}")
+    logger.info("Get clauses response: contract_id=%s count=%s", contract_id, len(clauses))
     return clauses
 
 
@@ -76,10 +82,10 @@ async def delete_contract(
     service: ContractService = Depends(get_contract_service),
 ):
     """Delete a contract and all associated data (chunks, clauses, risk assessments)."""
-    logger.info(f"Delete contract: contract_id={contract_id}")
+    logger.info("Delete contract: contract_id=%s", contract_id)
     try:
         await service.delete_contract(contract_id)
-        logger.info(f"Delete contract success: contract_id={contract_id}")
+        logger.info("Delete contract success: contract_id=%s", contract_id)
     except ContractNotFoundError:
-        logger.warning(f"Delete contract — not found: contract_id={contract_id}")
+        logger.warning("Delete contract — not found: contract_id=%s", contract_id)
         raise HTTPException(status_code=404, detail=f"Contract {contract_id} not found.")
@@ -28,12 +28,13 @@ async def query_contract(
     service: QueryService = Depends(get_query_service),
 ):
     """Ask a free-text question about a contract. Returns a grounded answer with source excerpts."""
-    logger.info(f"Query request: contract_id={contract_id} question={body.question!r}")
+    logger.info("Query request: contract_id=%s question=%r", contract_id, body.question)
     try:
         result = await service.query(contract_id, body.question)
         logger.info(
-            f"Query response: contract_id={contract_id} "
-            f"sources={len(result.sources)} model={result.model}"
+            "Query response: contract_id=%s "
+            "sources=%s model=%s",
+            contract_id, len(result.sources), result.model,
         )
         return result
     except ContractNotFoundError:
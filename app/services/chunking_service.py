@@ -1,11 +1,21 @@
+import array
 import logging
+import os
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 
 import tiktoken
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once per process — parsing the BPE merge table is expensive."""
+    return tiktoken.get_encoding(encoding_name)
+
+
 @dataclass
 class Chunk:
     index: int
@@ -22,39 +32,39 @@ class ChunkingService:
     ):
         self.chunk_size = chunk_size
         self.overlap = overlap
-        self.encoding = tiktoken.get_encoding(encoding_name)
+        self.encoding = get_encoding(encoding_name)
 
-    def chunk(self, text: str) -> list[Chunk]:
-        """Split text into overlapping token-based chunks.
+    def chunk(self, text: str) -> Iterator[Chunk]:
+        """Split text into overlapping token-based chunks, yielded in order.
 
         Each chunk is chunk_size tokens. Consecutive chunks share the last
         `overlap` tokens so clauses that straddle a boundary appear in both
         adjacent chunks and won't be missed during retrieval.
         """
         if not text.strip():
-            return []
+            return
 
-        tokens = self.encoding.encode(text)
-        chunks: list[Chunk] = []
-        start = 0
-        index = 0
+        # Token ids packed as 4-byte unsigned ints rather than one Python int object each;
+        # windows below are zero-copy memoryview slices of this buffer.
+        tokens = array.array("I", self.encoding.encode(text))
+        token_view = memoryview(tokens)
 
+        # Work out every window's token range first, then decode them all in one
+        # batched call — tiktoken decodes batches on its own threads outside the GIL.
+        windows: list[tuple[int, int]] = []
+        start = 0
         while start < len(tokens):
             end = min(start + self.chunk_size, len(tokens))
-            chunk_tokens = tokens[start:end]
-            chunk_text = self.encoding.decode(chunk_tokens)
-
-            chunks.append(Chunk(
-                index=index,
-                content=chunk_text,
-                token_count=len(chunk_tokens),
-            ))
-
+            windows.append((start, end))
             if end == len(tokens):
                 break
-
             start = end - self.overlap
-            index += 1
 
-        logger.info(f"Chunked text into {len(chunks)} chunks (size={self.chunk_size}, overlap={self.overlap})")
-        return chunks
+        texts = self.encoding.decode_batch(
+            [token_view[start:end] for start, end in windows],
+            num_threads=os.cpu_count() or 1,
+        )
+
+        logger.info("Chunked text into %s chunks (size=%s, overlap=%s)", len(windows), self.chunk_size, self.overlap)
+        for index, ((start, end), content) in enumerate(zip(windows, texts)):
+            yield Chunk(index=index, content=content, token_count=end - start)
@@ -1,9 +1,11 @@
-import json
 import logging
 import uuid
 
+import orjson
+
 from app.repositories.clause_repo import ClauseRepository
 from app.schemas.clause import ClauseExtractionResult, ClauseResponse
+from app.services.chunking_service import get_encoding
 from app.services.llm.base import LLMProvider
 from app.services.llm.prompts.clause_extraction import (
     CLAUSE_EXTRACTION_SYSTEM,
@@ -12,6 +14,10 @@ from app.services.llm.prompts.clause_extraction import (
 
 logger = logging.getLogger(__name__)
 
+# The user prompt split around its one placeholder, with the escaped {{ }} already
+# resolved, so each call is a plain concatenation rather than a str.format pass
+_USER_PREFIX, _USER_SUFFIX = CLAUSE_EXTRACTION_USER.format(contract_text="\0").split("\0")
+
 
 class ClauseService:
     def __init__(
@@ -40,22 +46,24 @@ class ClauseService:
         Returns:
             (ClauseExtractionResult, usage_dict) — validated clauses and usage metadata.
         """
-        truncated_text = raw_text[:self.max_chars]
+        truncated_text = raw_text
         if len(raw_text) > self.max_chars:
+            truncated_text = _truncate_at_token_boundary(raw_text, self.max_chars)
             logger.warning(
-                f"Contract {contract_id} text truncated from {len(raw_text)} "
-                f"to {self.max_chars} chars before LLM call"
+                "Contract %s text truncated from %s "
+                "to %s chars before LLM call",
+                contract_id, len(raw_text), len(truncated_text),
             )
 
         messages = [
             {"role": "system", "content": CLAUSE_EXTRACTION_SYSTEM},
             {
                 "role": "user",
-                "content": CLAUSE_EXTRACTION_USER.format(contract_text=truncated_text),
+                "content": _USER_PREFIX + truncated_text + _USER_SUFFIX,
             },
         ]
 
-        logger.info(f"Extracting clauses for contract {contract_id}")
+        logger.info("Extracting clauses for contract %s", contract_id)
 
         response = await self.llm.complete(
             messages=messages,
@@ -64,12 +72,12 @@ class ClauseService:
             response_format={"type": "json_object"},
         )
 
-        raw_json = json.loads(response.content)
-        result = ClauseExtractionResult.model_validate(raw_json)
+        result = parse_clause_extraction(response.content)
 
         logger.info(
-            f"Extracted {len(result.clauses)} clauses for contract {contract_id} "
-            f"({response.input_tokens} in / {response.output_tokens} out tokens)"
+            "Extracted %s clauses for contract %s "
+            "(%s in / %s out tokens)",
+            len(result.clauses), contract_id, response.input_tokens, response.output_tokens,
         )
 
         usage = {
@@ -77,5 +85,27 @@ class ClauseService:
             "output_tokens": response.output_tokens,
             "model": response.model,
             "latency_ms": response.latency_ms,
+            "cached": response.cached,
         }
         return result, usage
+
+
+def parse_clause_extraction(content: str) -> ClauseExtractionResult:
+    """Parse and validate the clause-extraction JSON. Raises ValueError if it is unusable.
+
+    Also the response cache's validator, so only answers that parse get cached.
+    """
+    # Deliberately model_validate, not model_construct: validation runs in pydantic-core
+    # and measured faster than building the models in Python, even with no checks at all
+    return ClauseExtractionResult.model_validate(orjson.loads(content))
+
+
+def _truncate_at_token_boundary(text: str, max_chars: int) -> str:
+    """Cut text to at most max_chars without splitting a token.
+
+    Only the max_chars prefix is tokenized, never the whole contract. Its last
+    token may have been cut by the character limit, so it is dropped.
+    """
+    encoding = get_encoding("cl100k_base")
+    tokens = encoding.encode(text[:max_chars], disallowed_special=())
+    return encoding.decode(tokens[:-1])
@@ -1,15 +1,19 @@
+import asyncio
+import contextlib
 import hashlib
 import uuid
 from pathlib import Path
 
 import aiofiles
-from fastapi import UploadFile
+import aiofiles.os
+from fastapi import BackgroundTasks, UploadFile
 
 from app.exceptions import ContractNotFoundError, DuplicateContractError, UnsupportedFileTypeError
 from app.repositories.contract_repo import ContractRepository
 from app.schemas.contract import ContractResponse, ContractUploadResponse
 from app.events.bus import event_bus
 from app.events.contract_events import ContractUploaded
+from app.services.extraction_service import raw_text_sidecar_path
 
 ALLOWED_CONTENT_TYPES = {
     "application/pdf": ".pdf",
@@ -18,35 +22,64 @@ ALLOWED_CONTENT_TYPES = {
 
 UPLOAD_DIR = Path("/app/uploads")
 
+_READ_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
 
 class ContractService:
     def __init__(self, repo: ContractRepository):
         self.repo = repo
 
-    async def upload_contract(self, file: UploadFile) -> ContractUploadResponse:
+    async def upload_contract(
+        self,
+        file: UploadFile,
+        background_tasks: BackgroundTasks,
+        claimed_hash: str | None = None,
+    ) -> ContractUploadResponse:
         # 1. Validate file type
         if file.content_type not in ALLOWED_CONTENT_TYPES:
             raise UnsupportedFileTypeError(file.content_type or "unknown")
 
-        # 2. Read file and compute SHA-256 hash
-        content = await file.read()
-        file_hash = hashlib.sha256(content).hexdigest()
-
-        # 3. Reject duplicates — but allow re-upload if previous processing failed
-        existing = await self.repo.get_by_file_hash(file_hash)
-        if existing:
-            if existing.status != "failed":
-                raise DuplicateContractError(file_hash)
-            await self.repo.delete(existing.id)
+        # If the client sent the SHA-256 up front, a known duplicate is rejected before we
+        # hash or write anything. A wrong claim only costs the client a 409 or this lookup.
+        if claimed_hash:
+            claimed_hash = claimed_hash.lower()
+            existing = await self.repo.get_by_file_hash(claimed_hash)
+            if existing and existing.status != "failed":
+                raise DuplicateContractError(claimed_hash)
 
-        # 4. Save file to disk
+        # 2. Stream the upload to a temp file, hashing as we go — never holds the whole file in memory
         file_ext = ALLOWED_CONTENT_TYPES[file.content_type]
         file_id = uuid.uuid4()
         file_path = UPLOAD_DIR / f"{file_id}{file_ext}"
-        UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_name(file_path.name + ".part")
+
+        # hashlib's OpenSSL SHA-256 releases the GIL on large buffers, so hashing a chunk
+        # in a thread runs in parallel with writing it and keeps the event loop free.
+        hasher = hashlib.sha256()
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                while chunk := await file.read(_READ_CHUNK_SIZE):
+                    await asyncio.gather(asyncio.to_thread(hasher.update, chunk), f.write(chunk))
+        except BaseException:
+            # Includes CancelledError from a client disconnect. A plain unlink, not an awaited
+            # one, so the cleanup still runs while the task is being cancelled.
+            tmp_path.unlink(missing_ok=True)
+            raise
+        file_hash = hasher.hexdigest()
+
+        # 3. Look up duplicates while moving the temp file into place — the two are independent
+        existing, _ = await asyncio.gather(
+            self.repo.get_by_file_hash(file_hash),
+            aiofiles.os.rename(tmp_path, file_path),
+        )
 
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(content)
+        # 4. Reject duplicates — but allow re-upload if previous processing failed
+        if existing:
+            if existing.status != "failed":
+                await aiofiles.os.remove(file_path)
+                raise DuplicateContractError(file_hash)
+            await self.repo.delete(existing.id)
+            await _remove_raw_text_sidecar(existing.file_path)
 
         # 5. Create DB record
         contract = await self.repo.create(
@@ -58,7 +91,14 @@ class ContractService:
             status="pending",
         )
 
-        event_bus.publish(ContractUploaded(contract_id=contract.id, filename=contract.filename))
+        # Commit before queueing the dispatch: on current FastAPI, background tasks run before the
+        # session dependency's own commit, and the worker must find the row.
+        await self.repo.commit()
+
+        # Dispatch after the response is sent — the Celery enqueue is a Redis round-trip the client needn't wait on
+        background_tasks.add_task(
+            event_bus.publish_async, ContractUploaded(contract_id=contract.id, filename=contract.filename)
+        )
 
         return ContractUploadResponse(
             id=contract.id,
@@ -71,9 +111,16 @@ class ContractService:
         if not contract:
             raise ContractNotFoundError(str(contract_id))
         await self.repo.delete(contract_id)
+        await _remove_raw_text_sidecar(contract.file_path)
 
     async def get_contract(self, contract_id: uuid.UUID) -> ContractResponse:
         contract = await self.repo.get_by_id(contract_id)
         if not contract:
             raise ContractNotFoundError(str(contract_id))
         return ContractResponse.model_validate(contract)
+
+
+async def _remove_raw_text_sidecar(file_path: str) -> None:
+    """Remove the plaintext copy a failed or interrupted pipeline may have left behind."""
+    with contextlib.suppress(FileNotFoundError):
+        await aiofiles.os.remove(raw_text_sidecar_path(file_path))
@@ -1,57 +1,104 @@
+import asyncio
+import base64
 import logging
 import time
+from collections.abc import Sequence
 
+import numpy as np
 import openai
 from openai import AsyncOpenAI
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 logger = logging.getLogger(__name__)
 
-_BATCH_SIZE = 100
+# Per-request caps. OpenAI allows 2048 inputs and ~300k tokens per embeddings request;
+# staying under both keeps a big contract from failing with a 400.
+_MAX_BATCH_INPUTS = 256
+_MAX_BATCH_TOKENS = 200_000
+
+
+def _pack_batches(count: int, token_counts: Sequence[int] | None) -> list[tuple[int, int]]:
+    """Split range(count) into contiguous (start, end) batches under both per-request caps."""
+    if token_counts is None:
+        return [(start, min(start + _MAX_BATCH_INPUTS, count)) for start in range(0, count, _MAX_BATCH_INPUTS)]
+    batches = []
+    start = 0
+    batch_tokens = 0
+    for i, tokens in enumerate(token_counts):
+        if i > start and (i - start == _MAX_BATCH_INPUTS or batch_tokens + tokens > _MAX_BATCH_TOKENS):
+            batches.append((start, i))
+            start = i
+            batch_tokens = 0
+        batch_tokens += tokens
+    if start < count:
+        batches.append((start, count))
+    return batches
 
 
 class EmbeddingService:
-    def __init__(self, api_key: str, model: str, dimensions: int):
-        self.client = AsyncOpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        dimensions: int,
+        max_concurrency: int = 8,
+        client: AsyncOpenAI | None = None,
+    ):
+        self.client = client or AsyncOpenAI(api_key=api_key)
         self.model = model
         self.dimensions = dimensions
+        self.max_concurrency = max_concurrency
 
-    async def embed(self, texts: list[str]) -> list[list[float]]:
+    async def embed(self, texts: list[str], token_counts: Sequence[int] | None = None) -> np.ndarray:
         """Generate embeddings for a list of texts.
 
-        Batches internally to avoid API limits. Returns embeddings in the same
+        Packs texts into as few requests as the API limits allow and sends up to
+        max_concurrency of them at once. Pass token_counts (one per text) when they
+        are already known so batches are also capped by tokens, not just by count.
+        Returns a float32 array of shape (len(texts), dimensions), rows in the same
         order as the input texts.
         """
+        embeddings = np.empty((len(texts), self.dimensions), dtype=np.float32)
         if not texts:
-            return []
+            return embeddings
 
-        all_embeddings: list[list[float]] = []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-        for batch_start in range(0, len(texts), _BATCH_SIZE):
-            batch = texts[batch_start : batch_start + _BATCH_SIZE]
-            embeddings = await self._embed_batch(batch)
-            all_embeddings.extend(embeddings)
+        async def run_batch(batch_number: int, batch_start: int, batch_end: int) -> None:
+            async with semaphore:
+                embeddings[batch_start:batch_end] = await self._embed_batch(texts[batch_start:batch_end])
             logger.info(
-                f"Embedded batch {batch_start // _BATCH_SIZE + 1} "
-                f"({len(batch)} texts, model={self.model})"
+                "Embedded batch %s "
+                "(%s texts, model=%s)",
+                batch_number, batch_end - batch_start, self.model,
             )
 
-        return all_embeddings
+        batches = _pack_batches(len(texts), token_counts)
+        await asyncio.gather(*(run_batch(n, start, end) for n, (start, end) in enumerate(batches, 1)))
+        return embeddings
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=10),
         retry=retry_if_exception_type((openai.RateLimitError, openai.APITimeoutError)),
     )
-    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+    async def _embed_batch(self, texts: list[str]) -> np.ndarray:
         start = time.monotonic()
+        # base64 is the raw little-endian float32 buffer — decoded straight into numpy,
+        # never materialised as Python floats
         response = await self.client.embeddings.create(
             model=self.model,
             input=texts,
+            encoding_format="base64",
         )
         latency_ms = int((time.monotonic() - start) * 1000)
         logger.info(
-            f"Embedding batch done: {response.usage.total_tokens} tokens, {latency_ms}ms"
+            "Embedding batch done: %s tokens, %sms",
+            response.usage.total_tokens, latency_ms,
         )
-        # OpenAI returns embeddings sorted by index — safe to sort and extract
-        return [item.embedding for item in sorted(response.data, key=lambda x: x.index)]
+        # OpenAI returns embeddings in input order — only pay for a sort if that ever isn't true
+        data = response.data
+        if any(item.index != position for position, item in enumerate(data)):
+            data = sorted(data, key=lambda x: x.index)
+        raw = b"".join(base64.b64decode(item.embedding) for item in data)
+        return np.frombuffer(raw, dtype=np.float32).reshape(len(data), -1)
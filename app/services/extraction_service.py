@@ -1,4 +1,10 @@
+import io
 import logging
+import mmap
+import os
+import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -6,6 +12,22 @@ logger = logging.getLogger(__name__)
 PDF_CONTENT_TYPE = "application/pdf"
 DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_OFFICE_DOCUMENT_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+_PACKAGE_RELS_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# PDFs above this size are parsed from a read-only memory map instead of buffered reads
+_MMAP_THRESHOLD = 1024 * 1024  # 1 MiB
+
+
+def raw_text_sidecar_path(file_path: str) -> str:
+    """Where extract_and_chunk leaves the extracted text for the next pipeline step.
+
+    Next to the upload, on the volume every worker mounts. Holds the full contract
+    plaintext, so whoever ends a contract's pipeline or deletes it removes this too.
+    """
+    return f"{file_path}.txt"
+
 
 @dataclass
 class ExtractionResult:
@@ -26,22 +48,107 @@ class ExtractionService:
     def _extract_pdf(self, file_path: str) -> ExtractionResult:
         import pymupdf
 
-        doc = pymupdf.open(file_path)
-        pages = [page.get_text() for page in doc]
-        doc.close()
-        logger.info(f"Extracted {len(pages)} pages from PDF: {file_path}")
+        if os.path.getsize(file_path) > _MMAP_THRESHOLD:
+            with _mapped(file_path) as view:
+                raw_text, page_count = _pdf_text(pymupdf.open(stream=view, filetype="pdf"))
+        else:
+            raw_text, page_count = _pdf_text(pymupdf.open(file_path))
+        logger.info("Extracted %s pages from PDF: %s", page_count, file_path)
         return ExtractionResult(
-            raw_text="\n\n".join(pages),
-            page_count=len(pages),
+            raw_text=raw_text,
+            page_count=page_count,
         )
 
     def _extract_docx(self, file_path: str) -> ExtractionResult:
-        from docx import Document
+        from lxml import etree
 
-        doc = Document(file_path)
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-        logger.info(f"Extracted {len(paragraphs)} paragraphs from DOCX: {file_path}")
+        # Stream word/document.xml instead of building python-docx's object tree.
+        # Same text as python-docx's Document.paragraphs: body-level paragraphs only, so
+        # table cells are skipped, and each paragraph is its direct runs and hyperlinks.
+        paragraphs = []
+        with zipfile.ZipFile(file_path) as z, z.open(_docx_main_part(z)) as f:
+            for _, p in etree.iterparse(f, events=("end",), tag=f"{_W}p"):
+                body = p.getparent()
+                if body.tag != f"{_W}body":
+                    continue
+                text = "".join(_docx_paragraph_text(p))
+                if text.strip():
+                    paragraphs.append(text)
+                # Drop everything parsed so far — memory stays flat on long documents
+                p.clear()
+                while p.getprevious() is not None:
+                    del body[0]
+        logger.info("Extracted %s paragraphs from DOCX: %s", len(paragraphs), file_path)
         return ExtractionResult(
             raw_text="\n\n".join(paragraphs),
             page_count=1,
         )
+
+
+@contextmanager
+def _mapped(file_path: str) -> Iterator[memoryview]:
+    """Map a file read-only. PyMuPDF opens a memoryview in place, without copying it."""
+    with (
+        open(file_path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        memoryview(mm) as view,
+    ):
+        yield view
+
+
+def _pdf_text(doc) -> tuple[str, int]:
+    """Return the document's text, pages separated by a blank line, and its page count.
+
+    Pages are written straight into one buffer as they are extracted rather than
+    collected into a list and joined, so every page string can be freed early.
+    """
+    # Deliberately serial: PyMuPDF is not thread-safe and holds the GIL inside get_text(),
+    # so a thread pool would risk corrupting the document without any speedup.
+    buf = io.StringIO()
+    page_count = 0
+    try:
+        for page in doc:
+            if page_count:
+                buf.write("\n\n")
+            buf.write(page.get_text())
+            page_count += 1
+    finally:
+        doc.close()
+    return buf.getvalue(), page_count
+
+
+def _docx_main_part(z: zipfile.ZipFile) -> str:
+    """Path of the main document part, as named by the package relationships."""
+    from lxml import etree
+
+    rels = etree.fromstring(z.read("_rels/.rels"))
+    for rel in rels.iter(f"{_PACKAGE_RELS_NS}Relationship"):
+        if rel.get("Type") == _OFFICE_DOCUMENT_REL:
+            return rel.get("Target").lstrip("/")
+    return "word/document.xml"
+
+
+def _docx_paragraph_text(p) -> Iterator[str]:
+    for child in p:
+        if child.tag == f"{_W}r":
+            yield from _docx_run_text(child)
+        elif child.tag == f"{_W}hyperlink":
+            for r in child.iterchildren(f"{_W}r"):
+                yield from _docx_run_text(r)
+
+
+def _docx_run_text(r) -> Iterator[str]:
+    for child in r:
+        tag = child.tag
+        if tag == f"{_W}t":
+            yield child.text or ""
+        elif tag == f"{_W}tab" or tag == f"{_W}ptab":
+            yield "\t"
+        elif tag == f"{_W}br":
+            # Page and column breaks carry no text; only line breaks do
+            if child.get(f"{_W}type", "textWrapping") == "textWrapping":
+                yield "\n"
+        elif tag == f"{_W}cr":
+            yield "\n"
+        elif tag == f"{_W}noBreakHyphen":
+            yield "-"
@@ -9,6 +9,8 @@ class LLMResponse:
     output_tokens: int
     model: str
     latency_ms: int
+    cached: bool = False  # served from the LLM response cache; tokens are 0
+    finish_reason: str | None = None  # "stop" for a complete answer, "length" if cut off at max_tokens
 
 
 class LLMProvider(ABC):
@@ -0,0 +1,134 @@
+import hashlib
+import logging
+import time
+from collections.abc import Callable
+from typing import Any, Protocol
+
+import orjson
+import redis.asyncio as redis_asyncio
+from redis.exceptions import RedisError
+
+from app.services.llm.base import LLMProvider, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCacheBackend(Protocol):
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None: ...
+
+
+class RedisLLMCache:
+    """LLMCacheBackend on Redis — in the stack this is the Celery broker instance."""
+
+    def __init__(self, url: str, prefix: str = "llm-cache:"):
+        self.client = redis_asyncio.Redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        await self.client.set(self.prefix + key, value, ex=ttl_seconds)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+class CachingLLMProvider(LLMProvider):
+    """Wrap a provider so identical requests are answered from a cache.
+
+    The key is a SHA-256 of the namespace (provider and model) and the full request,
+    so any prompt change misses automatically. Hits come back with zero tokens and
+    cached=True. Cache errors are logged and fall through to the real provider —
+    the cache must never fail a request.
+
+    Only complete answers (finish_reason "stop") that pass `validate` are stored.
+    `validate` should parse the content exactly as the caller will and raise
+    ValueError (pydantic's ValidationError is one) if it is unusable, so a bad
+    answer is retried against the provider instead of replayed from the cache.
+    """
+
+    def __init__(
+        self,
+        inner: LLMProvider,
+        backend: LLMCacheBackend,
+        namespace: str,
+        ttl_seconds: int,
+        validate: Callable[[str], Any] | None = None,
+    ):
+        self.inner = inner
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.validate = validate
+
+    async def complete(
+        self,
+        messages: list[dict],
+        temperature: float = 0.0,
+        max_tokens: int = 2000,
+        response_format: dict | None = None,
+    ) -> LLMResponse:
+        start = time.monotonic()
+        key = hashlib.sha256(
+            orjson.dumps(
+                {
+                    "namespace": self.namespace,
+                    "messages": messages,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                    "response_format": response_format,
+                },
+                option=orjson.OPT_SORT_KEYS,
+            )
+        ).hexdigest()
+
+        try:
+            cached = await self.backend.get(key)
+        except RedisError:
+            logger.warning("LLM cache read failed, calling provider", exc_info=True)
+            cached = None
+        if cached is not None:
+            entry = orjson.loads(cached)
+            return LLMResponse(
+                content=entry["content"],
+                input_tokens=0,
+                output_tokens=0,
+                model=entry["model"],
+                latency_ms=int((time.monotonic() - start) * 1000),
+                cached=True,
+                finish_reason="stop",
+            )
+
+        response = await self.inner.complete(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=response_format,
+        )
+        if not self._cacheable(response):
+            return response
+        try:
+            await self.backend.set(
+                key, orjson.dumps({"content": response.content, "model": response.model}), self.ttl_seconds
+            )
+        except RedisError:
+            logger.warning("LLM cache write failed", exc_info=True)
+        return response
+
+    def _cacheable(self, response: LLMResponse) -> bool:
+        if response.content is None or response.finish_reason != "stop":
+            logger.warning(
+                "Not caching incomplete LLM response (finish_reason=%s, empty=%s)",
+                response.finish_reason, response.content is None,
+            )
+            return False
+        if self.validate is not None:
+            try:
+                self.validate(response.content)
+            except ValueError:
+                logger.warning("Not caching LLM response that failed validation")
+                return False
+        return True
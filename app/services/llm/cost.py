@@ -1,13 +1,15 @@
-_PRICING: dict[str, dict[str, float]] = {
-    "gpt-4o-mini": {"input": 0.15, "output": 0.60},
-    "gpt-4o": {"input": 2.50, "output": 10.00},
+# (input, output) USD per token — OpenAI's per-1M list prices, pre-scaled so a lookup is two multiplies
+_RATES: dict[str, tuple[float, float]] = {
+    "gpt-4o-mini": (0.15e-6, 0.60e-6),
+    "gpt-4o": (2.50e-6, 10.00e-6),
 }
+_DEFAULT_RATES = _RATES["gpt-4o-mini"]
 
 
 def estimate_llm_cost(input_tokens: int, output_tokens: int, model: str) -> float:
-    """Estimate cost in USD based on OpenAI pricing (per 1M tokens).
+    """Estimate cost in USD based on OpenAI pricing.
 
     Falls back to gpt-4o-mini rates for unknown models.
     """
-    rates = _PRICING.get(model, _PRICING["gpt-4o-mini"])
-    return (input_tokens * rates["input"] + output_tokens * rates["output"]) / 1_000_000
+    input_rate, output_rate = _RATES.get(model, _DEFAULT_RATES)
+    return input_tokens * input_rate + output_tokens * output_rate
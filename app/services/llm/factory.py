@@ -1,15 +1,33 @@
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
 from app.services.llm.base import LLMProvider
 
 
-def create_llm_provider(settings) -> LLMProvider:
+def create_openai_client(api_key: str) -> AsyncOpenAI:
+    """Build one AsyncOpenAI client to share between the LLM provider and EmbeddingService.
+
+    The httpx pool is larger than the SDK default and speaks HTTP/2, so concurrent
+    embedding batches and completions reuse a few TLS connections instead of
+    handshaking per client. Close it with `await client.close()` on shutdown.
+    """
+    http_client = DefaultAsyncHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
+
+
+def create_llm_provider(settings, openai_client: AsyncOpenAI | None = None) -> LLMProvider:
     """Create and return the configured LLM provider.
 
     Reads LLM_PROVIDER from settings. Adding a new provider = one new elif block here,
-    zero changes to business logic elsewhere.
+    zero changes to business logic elsewhere. `openai_client` is reused by the OpenAI
+    provider when given; otherwise it builds its own.
     """
     if settings.LLM_PROVIDER == "openai":
         from app.services.llm.openai_provider import OpenAIProvider
-        return OpenAIProvider(api_key=settings.OPENAI_API_KEY, model=settings.LLM_MODEL)
+        return OpenAIProvider(api_key=settings.OPENAI_API_KEY, model=settings.LLM_MODEL, client=openai_client)
 
     if settings.LLM_PROVIDER == "groq":
         from app.services.llm.groq_provider import GroqProvider
@@ -50,4 +50,5 @@ class GroqProvider(LLMProvider):
             output_tokens=response.usage.completion_tokens,
             model=response.model,
             latency_ms=latency_ms,
+            finish_reason=response.choices[0].finish_reason,
         )
@@ -11,8 +11,8 @@ logger = logging.getLogger(__name__)
 
 
 class OpenAIProvider(LLMProvider):
-    def __init__(self, api_key: str, model: str):
-        self.client = AsyncOpenAI(api_key=api_key)
+    def __init__(self, api_key: str, model: str, client: AsyncOpenAI | None = None):
+        self.client = client or AsyncOpenAI(api_key=api_key)
         self.model = model
 
     @retry(
@@ -47,4 +47,5 @@ class OpenAIProvider(LLMProvider):
             output_tokens=response.usage.completion_tokens,
             model=response.model,
             latency_ms=latency_ms,
+            finish_reason=response.choices[0].finish_reason,
         )
@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.exceptions import ContractNotFoundError
 from app.repositories.contract_repo import ContractRepository
 from app.repositories.embedding_repo import EmbeddingRepository
-from app.repositories.llm_usage_log_repo import LLMUsageLogRepository
+from app.repositories.llm_usage_log_repo import LLMUsageLogBuffer, LLMUsageLogRepository
 from app.schemas.query import QueryResponse, SourceChunk
 from app.services.embedding_service import EmbeddingService
 from app.services.llm.base import LLMProvider
@@ -31,11 +31,13 @@ class QueryService:
         llm: LLMProvider,
         embedding_service: EmbeddingService,
         llm_provider_name: str,
+        usage_log_buffer: LLMUsageLogBuffer | None = None,
     ):
         self.session = session
         self.llm = llm
         self.embedding_service = embedding_service
         self.llm_provider_name = llm_provider_name
+        self.usage_log_buffer = usage_log_buffer
 
         # All repos share the same session — they participate in the same DB transaction
         self._contract_repo = ContractRepository(session)
@@ -50,7 +52,7 @@ class QueryService:
         if not contract:
             raise ContractNotFoundError(str(contract_id))
 
-        logger.info(f"[query] contract={contract_id} question={question!r}")
+        logger.info("[query] contract=%s question=%r", contract_id, question)
 
         # Step 2: Embed the question using the same model that embedded the chunks.
         # This is critical — if you embed the question with a different model than
@@ -69,7 +71,7 @@ class QueryService:
         # Edge case: contract was uploaded but embeddings were never generated
         # (e.g. processing failed mid-way). Return a safe fallback instead of crashing.
         if not results:
-            logger.warning(f"[query] No embedded chunks for contract={contract_id}")
+            logger.warning("[query] No embedded chunks for contract=%s", contract_id)
             return QueryResponse(
                 contract_id=contract_id,
                 question=question,
@@ -103,14 +105,16 @@ class QueryService:
         )
 
         logger.info(
-            f"[query] done contract={contract_id} "
-            f"tokens={response.input_tokens}in/{response.output_tokens}out "
-            f"latency={response.latency_ms}ms"
+            "[query] done contract=%s "
+            "tokens=%sin/%sout "
+            "latency=%sms",
+            contract_id, response.input_tokens, response.output_tokens, response.latency_ms,
         )
 
         # Step 6: Log every LLM call — provider, model, tokens, cost, latency.
         # This is how we track spend. Every query costs money; logging makes it visible.
-        await self._log_repo.create(
+        # With a buffer injected the row is written in the background, off the response path.
+        usage_log = dict(
             contract_id=contract_id,
             provider=self.llm_provider_name,
             model=response.model,
@@ -121,6 +125,10 @@ class QueryService:
             latency_ms=response.latency_ms,
             success=True,
         )
+        if self.usage_log_buffer is not None:
+            self.usage_log_buffer.add(**usage_log)
+        else:
+            await self._log_repo.create(**usage_log)
 
         # Step 7: Build the source list from the retrieved chunks.
         # We include the real cosine similarity score from pgvector so the caller
@@ -1,8 +1,8 @@
-import json
 import logging
 import uuid
 from typing import Literal
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exceptions import ContractNotFoundError
@@ -55,13 +55,16 @@ class RiskService:
         """Score all clauses for a contract. Called by the Celery task."""
         clauses = await self._clause_repo.get_by_contract_id(contract_id)
         if not clauses:
-            logger.warning(f"[risk] No clauses found for contract={contract_id}")
+            logger.warning("[risk] No clauses found for contract=%s", contract_id)
             return
 
-        logger.info(f"[risk] Scoring {len(clauses)} clauses for contract={contract_id}")
-        assessments = [await self._score_clause(contract_id, c) for c in clauses]
+        logger.info("[risk] Scoring %s clauses for contract=%s", len(clauses), contract_id)
+        scored = [await self._score_clause(contract_id, c) for c in clauses]
+        assessments = [assessment for assessment, _ in scored]
+        # One INSERT for all of this contract's LLM calls instead of one flush per clause
+        await self._log_repo.create_many([usage_log for _, usage_log in scored])
         await self._risk_repo.bulk_create(assessments)
-        logger.info(f"[risk] Saved {len(assessments)} assessments for contract={contract_id}")
+        logger.info("[risk] Saved %s assessments for contract=%s", len(assessments), contract_id)
 
     async def get_analysis(self, contract_id: uuid.UUID) -> ContractAnalysisResponse:
         """Return all clauses with risk scores and overall contract risk."""
@@ -81,7 +84,8 @@ class RiskService:
             clauses=clause_responses,
         )
 
-    async def _score_clause(self, contract_id: uuid.UUID, clause: Clause) -> dict:
+    async def _score_clause(self, contract_id: uuid.UUID, clause: Clause) -> tuple[dict, dict]:
+        """Score one clause. Returns (risk assessment row, LLM usage log row)."""
         # Stage 1: rule engine — free and instant
         rule_score, flags = score_clause(clause.clause_type, clause.content)
 
@@ -105,27 +109,28 @@ class RiskService:
             response_format={"type": "json_object"},
         )
 
-        llm_output = ClauseRiskLLMOutput.model_validate(json.loads(response.content))
-
-        await self._log_repo.create(
-            contract_id=contract_id,
-            provider=self.llm_provider_name,
-            model=response.model,
-            operation="risk_assessment",
-            input_tokens=response.input_tokens,
-            output_tokens=response.output_tokens,
-            cost_usd=estimate_llm_cost(response.input_tokens, response.output_tokens, response.model),
-            latency_ms=response.latency_ms,
-            success=True,
-        )
+        llm_output = ClauseRiskLLMOutput.model_validate(orjson.loads(response.content))
+
+        usage_log = {
+            "contract_id": contract_id,
+            "provider": self.llm_provider_name,
+            "model": response.model,
+            "operation": "risk_assessment",
+            "input_tokens": response.input_tokens,
+            "output_tokens": response.output_tokens,
+            "cost_usd": estimate_llm_cost(response.input_tokens, response.output_tokens, response.model),
+            "latency_ms": response.latency_ms,
+            "success": True,
+        }
 
         combined_score = round(_RULE_WEIGHT * rule_score + _LLM_WEIGHT * llm_output.risk_score, 4)
         logger.info(
-            f"[risk] clause={clause.id} type={clause.clause_type} "
-            f"rule={rule_score} llm={llm_output.risk_score} combined={combined_score} flags={flags}"
+            "[risk] clause=%s type=%s "
+            "rule=%s llm=%s combined=%s flags=%s",
+            clause.id, clause.clause_type, rule_score, llm_output.risk_score, combined_score, flags,
         )
 
-        return {
+        assessment = {
             "clause_id": clause.id,
             "risk_level": _risk_level(combined_score),
             "risk_score": combined_score,
@@ -134,6 +139,7 @@ class RiskService:
             "explanation": llm_output.explanation,
             "flags": flags,
         }
+        return assessment, usage_log
 
 
 def _build_clause_response(clause: Clause) -> ClauseWithRiskResponse:
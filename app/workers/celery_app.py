@@ -1,6 +1,11 @@
 import os
 
 from celery import Celery
+from celery.signals import worker_init
+
+from app.workers.serialization import SERIALIZER, register_serializer
+
+register_serializer()
 
 redis_url = os.getenv("REDIS_URL", "redis://redis:6379/0")
 
@@ -12,12 +17,30 @@ celery_app = Celery(
 )
 
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # msgpack with a UUID extension: contract ids travel as 16 raw bytes and arrive as
+    # uuid.UUID. Only this format is accepted: a json message queued before the switch fails
+    # with ContentDisallowed and the worker logs and discards it.
+    task_serializer=SERIALIZER,
+    accept_content=[SERIALIZER],
+    result_serializer=SERIALIZER,
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
     task_acks_late=True,
     worker_prefetch_multiplier=1,
+    # Parsing and LLM work get separate queues so minute-long LLM tasks never sit in
+    # front of quick extraction work; see docker-compose.yml for the worker per queue.
+    task_routes={
+        "app.workers.contract_tasks.task_extract_and_chunk": {"queue": "io_cpu"},
+        "app.workers.contract_tasks.task_extract_clauses_and_embed": {"queue": "llm"},
+        "app.workers.contract_tasks.task_score_risk": {"queue": "llm"},
+    },
 )
+
+
+@worker_init.connect
+def _load_settings(**kwargs) -> None:
+    """Parse Settings once in the parent process so forked pool children inherit it."""
+    from app.config import get_settings
+
+    get_settings()
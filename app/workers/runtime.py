@@ -0,0 +1,139 @@
+import asyncio
+import threading
+from collections.abc import Coroutine
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from celery.signals import worker_process_init, worker_process_shutdown
+from openai import AsyncOpenAI
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.config import Settings, get_settings
+from app.database import create_engine, create_session_factory
+from app.services.chunking_service import ChunkingService
+from app.services.clause_service import parse_clause_extraction
+from app.services.embedding_service import EmbeddingService
+from app.services.extraction_service import ExtractionService
+from app.services.llm.base import LLMProvider
+from app.services.llm.cache import CachingLLMProvider, RedisLLMCache
+from app.services.llm.factory import create_llm_provider, create_openai_client
+
+T = TypeVar("T")
+
+
+@dataclass
+class Runtime:
+    """Everything a worker process builds once and reuses across tasks.
+
+    Tasks used to wrap every body in asyncio.run() and build/dispose an engine and
+    their LLM clients each time, so every task paid a fresh loop, fresh Postgres
+    connections and fresh TLS handshakes. Here one loop runs for the life of the
+    process and the engine pool and HTTP clients stay bound to it.
+    """
+
+    settings: Settings
+    loop: asyncio.AbstractEventLoop
+    thread: threading.Thread
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    openai_client: AsyncOpenAI
+    llm: LLMProvider
+    # llm behind the Redis response cache — clause extraction only; None when disabled
+    llm_cache: RedisLLMCache | None
+    clause_llm: LLMProvider
+    embedder: EmbeddingService
+    extractor: ExtractionService
+    chunker: ChunkingService
+
+
+_lock = threading.Lock()
+_runtime: Runtime | None = None
+
+
+def get() -> Runtime:
+    """Return this process's Runtime, starting it on first use (solo pool, eager mode)."""
+    if _runtime is None:
+        start()
+    return _runtime
+
+
+def start() -> None:
+    """Start the event loop thread and build the shared clients. Safe to call repeatedly."""
+    global _runtime
+    with _lock:
+        if _runtime is not None:
+            return
+        settings = get_settings()
+        engine = create_engine(settings)
+        openai_client = create_openai_client(settings.OPENAI_API_KEY)
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, name="worker-event-loop", daemon=True)
+        thread.start()
+        llm = create_llm_provider(settings, openai_client)
+        llm_cache = RedisLLMCache(settings.REDIS_URL) if settings.LLM_CACHE_TTL_SECONDS > 0 else None
+        _runtime = Runtime(
+            settings=settings,
+            loop=loop,
+            thread=thread,
+            engine=engine,
+            session_factory=create_session_factory(engine),
+            openai_client=openai_client,
+            llm=llm,
+            llm_cache=llm_cache,
+            clause_llm=(
+                CachingLLMProvider(
+                    llm,
+                    llm_cache,
+                    namespace=f"{settings.LLM_PROVIDER}:{settings.LLM_MODEL}",
+                    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+                    validate=parse_clause_extraction,
+                )
+                if llm_cache
+                else llm
+            ),
+            embedder=EmbeddingService(
+                api_key=settings.OPENAI_API_KEY,
+                model=settings.EMBEDDING_MODEL,
+                dimensions=settings.EMBEDDING_DIMENSION,
+                max_concurrency=settings.EMBEDDING_MAX_CONCURRENCY,
+                client=openai_client,
+            ),
+            extractor=ExtractionService(),
+            chunker=ChunkingService(chunk_size=settings.CHUNK_SIZE, overlap=settings.CHUNK_OVERLAP),
+        )
+
+
+def stop() -> None:
+    """Close the shared clients, dispose the engine and stop the loop thread."""
+    global _runtime
+    with _lock:
+        if _runtime is None:
+            return
+        rt, _runtime = _runtime, None
+
+        async def close() -> None:
+            await rt.openai_client.close()
+            if rt.llm_cache:
+                await rt.llm_cache.close()
+            await rt.engine.dispose()
+
+        asyncio.run_coroutine_threadsafe(close(), rt.loop).result()
+        rt.loop.call_soon_threadsafe(rt.loop.stop)
+        rt.thread.join()
+        rt.loop.close()
+
+
+def run_coro(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the worker loop and block the calling (task) thread for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, get().loop).result()
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**kwargs) -> None:
+    # Runs in each pool child after the fork — a loop thread does not survive fork()
+    start()
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**kwargs) -> None:
+    stop()
@@ -0,0 +1,40 @@
+import uuid
+
+import msgpack
+from kombu.serialization import register
+
+SERIALIZER = "msgpack-uuid"
+
+# msgpack extension type code for uuid.UUID — payload is the 16 raw bytes
+_UUID_EXT = 1
+
+
+def _default(obj):
+    if isinstance(obj, uuid.UUID):
+        return msgpack.ExtType(_UUID_EXT, obj.bytes)
+    raise TypeError(f"Cannot serialize {type(obj).__name__} to msgpack")
+
+
+def _ext_hook(code: int, data: bytes):
+    if code == _UUID_EXT:
+        return uuid.UUID(bytes=data)
+    return msgpack.ExtType(code, data)
+
+
+def dumps(obj) -> bytes:
+    return msgpack.packb(obj, default=_default, use_bin_type=True)
+
+
+def loads(data: bytes):
+    return msgpack.unpackb(data, ext_hook=_ext_hook, raw=False)
+
+
+def register_serializer() -> None:
+    """Register msgpack with native UUIDs so task args and results carry uuid.UUID, not str."""
+    register(
+        SERIALIZER,
+        dumps,
+        loads,
+        content_type="application/x-msgpack-uuid",
+        content_encoding="binary",
+    )
@@ -0,0 +1,114 @@
+import asyncio
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from billiard.exceptions import WorkerLostError
+from celery.exceptions import Retry
+
+from app.services.extraction_service import raw_text_sidecar_path
+from app.workers import contract_tasks
+
+
+class FakeSession:
+    def __init__(self):
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def commit(self):
+        self.committed = True
+
+
+class FakeContractRepository:
+    """Stands in for ContractRepository inside _mark_failed; records status updates."""
+
+    statuses: dict[uuid.UUID, tuple[str, str | None]] = {}
+    file_paths: dict[uuid.UUID, str] = {}
+
+    def __init__(self, session):
+        self.session = session
+
+    async def update_status(self, contract_id, status, error_message=None):
+        self.statuses[contract_id] = (status, error_message)
+
+    async def get_file_path(self, contract_id):
+        return self.file_paths.get(contract_id)
+
+
+@pytest.fixture
+def contract(tmp_path: Path, monkeypatch):
+    """A contract in "processing" with its raw-text sidecar on disk, and the worker runtime faked out."""
+    contract_id = uuid.uuid4()
+    file_path = tmp_path / f"{contract_id}.pdf"
+    sidecar = Path(raw_text_sidecar_path(str(file_path)))
+    sidecar.write_text("full contract plaintext", encoding="utf-8")
+
+    FakeContractRepository.statuses = {contract_id: ("processing", None)}
+    FakeContractRepository.file_paths = {contract_id: str(file_path)}
+    monkeypatch.setattr(contract_tasks, "ContractRepository", FakeContractRepository)
+    monkeypatch.setattr(contract_tasks.runtime, "run_coro", asyncio.run)
+    monkeypatch.setattr(contract_tasks.runtime, "get", lambda: SimpleNamespace(session_factory=FakeSession))
+    return SimpleNamespace(id=contract_id, sidecar=sidecar)
+
+
+async def _failing_step():
+    raise RuntimeError("parse failed")
+
+
+def test_run_step_marks_failed_and_removes_sidecar_once_retries_are_exhausted(contract):
+    task = contract_tasks.task_extract_clauses_and_embed
+    task.push_request(retries=task.max_retries)
+    try:
+        with pytest.raises(RuntimeError, match="parse failed"):
+            contract_tasks._run_step(task, "extract_clauses_and_embed", contract.id, _failing_step())
+    finally:
+        task.pop_request()
+
+    assert FakeContractRepository.statuses[contract.id] == ("failed", "parse failed")
+    assert not contract.sidecar.exists()
+
+
+def test_run_step_retries_before_the_last_attempt(contract, monkeypatch):
+    task = contract_tasks.task_extract_clauses_and_embed
+
+    def fake_retry(exc):
+        return Retry(exc=exc)
+
+    monkeypatch.setattr(task, "retry", fake_retry)
+    task.push_request(retries=task.max_retries - 1)
+    try:
+        with pytest.raises(Retry):
+            contract_tasks._run_step(task, "extract_clauses_and_embed", contract.id, _failing_step())
+    finally:
+        task.pop_request()
+
+    assert FakeContractRepository.statuses[contract.id] == ("processing", None)
+    assert contract.sidecar.exists()
+
+
+@pytest.mark.parametrize(
+    ("task_name", "first_arg"),
+    [("task_extract_and_chunk", "id"), ("task_score_risk", "prev_result")],
+)
+def test_worker_lost_marks_contract_failed(contract, task_name, first_arg):
+    task = getattr(contract_tasks, task_name)
+    arg = contract.id if first_arg == "id" else {"contract_id": contract.id, "status": "chunked"}
+
+    contract_tasks.task_failure.send(sender=task, task_id="t", exception=WorkerLostError("SIGKILL"), args=[arg])
+
+    assert FakeContractRepository.statuses[contract.id] == ("failed", "SIGKILL")
+    assert not contract.sidecar.exists()
+
+
+def test_ordinary_task_failure_is_left_to_run_step(contract):
+    task = contract_tasks.task_extract_and_chunk
+
+    contract_tasks.task_failure.send(sender=task, task_id="t", exception=RuntimeError("boom"), args=[contract.id])
+
+    assert FakeContractRepository.statuses[contract.id] == ("processing", None)